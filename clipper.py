@@ -4,17 +4,24 @@
 from __future__ import annotations
 
 import argparse
+import bisect
+import copy
 import dataclasses
 import difflib
-import json
+import functools
+import io
 import math
+import os
 import re
 import sys
 import subprocess
+import threading
+import time
 from pathlib import Path
-from typing import Iterable, List, Optional, Sequence
+from typing import Iterable, List, Optional, Sequence, Tuple
 
 from stt_providers import STTProviderError, get_stt_provider
+from youtube_ids import video_id_from_url
 
 try:
     from yt_dlp import YoutubeDL
@@ -24,6 +31,31 @@ except ModuleNotFoundError as exc:  # pragma: no cover - dependency guard
         "Install it with 'pip install yt-dlp'."
     ) from exc
 
+try:
+    from rapidfuzz import fuzz as rf_fuzz, process as rf_process
+except ModuleNotFoundError:  # pragma: no cover - optional accelerator
+    rf_fuzz = rf_process = None
+
+try:
+    from orjson import loads as json_loads
+except ModuleNotFoundError:  # pragma: no cover - optional accelerator
+    from json import loads as json_loads
+
+try:
+    import av
+except ModuleNotFoundError:  # pragma: no cover - optional accelerator
+    av = None
+
+TRANSCRIPT_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "clipper"
+TRANSCRIPT_CACHE_TTL = 24 * 60 * 60  # seconds
+
+_WS_RE = re.compile(r"\s+")
+_PUNCT_RE = re.compile(r"[^\w\s]", re.UNICODE)
+_FN_KEEP_RE = re.compile(r"[^\w\s-]")
+# Same character class as _PUNCT_RE, restricted to ASCII for str.translate.
+_ASCII_PUNCT_TABLE = str.maketrans({chr(code): None for code in range(128) if _PUNCT_RE.match(chr(code))})
+
+
 @dataclasses.dataclass
 class Segment:
     text: str
@@ -51,26 +83,37 @@ class TranscriptUnavailableError(RuntimeError):
     """Raised when subtitle data cannot be retrieved for the requested video."""
 
 
+class _SilentLogger:
+    """Discards yt-dlp messages for lookups whose failure is not fatal."""
+
+    def debug(self, message: str) -> None:
+        pass
+
+    warning = error = debug
+
+
+@functools.lru_cache(maxsize=4096)
 def normalize(text: str) -> str:
-    cleaned = re.sub(r"\s+", " ", text).strip().lower()
-    cleaned = re.sub(r"[^\w\s]", "", cleaned, flags=re.UNICODE)
-    return cleaned
+    if text.isascii():
+        text = text.translate(_ASCII_PUNCT_TABLE)
+    else:
+        text = _PUNCT_RE.sub("", text)
+    return _WS_RE.sub(" ", text).strip().lower()
 
 
 def format_timestamp(seconds: float) -> str:
-    seconds = max(0.0, seconds)
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = seconds - (hours * 3600 + minutes * 60)
-    return f"{hours:02d}:{minutes:02d}:{secs:06.3f}"
+    total_ms = int(round(max(0.0, seconds) * 1000))
+    minutes, millis = divmod(total_ms, 60_000)
+    hours, minutes = divmod(minutes, 60)
+    secs, millis = divmod(millis, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}.{millis:03d}"
 
 
 def format_srt_timestamp(seconds: float) -> str:
-    seconds = max(0.0, seconds)
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    millis = int(round((seconds - int(seconds)) * 1000))
+    total_ms = int(round(max(0.0, seconds) * 1000))
+    minutes, millis = divmod(total_ms, 60_000)
+    hours, minutes = divmod(minutes, 60)
+    secs, millis = divmod(millis, 1000)
     return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
 
 
@@ -80,27 +123,41 @@ def status(message: str) -> None:
 
 def read_segments_from_json3(data: dict) -> List[Segment]:
     segments: List[Segment] = []
+    append = segments.append
+    make_segment = Segment
+    ws_sub = _WS_RE.sub
+    last_end: Optional[float] = None
     events: Iterable[dict] = data.get("events") or []
     for event in events:
-        if event.get("tStartMs") is None:
+        get = event.get
+        start_ms = get("tStartMs")
+        if start_ms is None:
             continue
-        start_ms = event["tStartMs"]
-        end_ms = event.get("tStartMs") + event.get("dDurationMs", 0)
-        if not end_ms and event.get("tEndMs") is not None:
-            end_ms = event["tEndMs"]
+        end_ms = start_ms + get("dDurationMs", 0)
+        if not end_ms:
+            end_ms = get("tEndMs")
         if not end_ms:
             # Fallback to one second duration if nothing else is provided.
             end_ms = start_ms + 1000
-        text_fragments = []
-        for seg in event.get("segs") or []:
-            piece = seg.get("utf8")
-            if piece:
-                text_fragments.append(piece)
-        text = re.sub(r"\s+", " ", "".join(text_fragments)).strip()
+        pieces = (seg.get("utf8") for seg in get("segs") or ())
+        text = ws_sub(" ", "".join(piece for piece in pieces if piece)).strip()
         if not text:
             continue
-        segments.append(Segment(text=text, start=start_ms / 1000.0, end=end_ms / 1000.0))
+        start = start_ms / 1000.0
+        end = end_ms / 1000.0
+        # Keep the timeline strictly increasing as segments are produced
+        # (same rules as ensure_monotonic_timeline, without a second pass).
+        if last_end is not None:
+            if start < last_end:
+                start = last_end
+            if end <= start:
+                end = start + 0.5
+        append(make_segment(text=text, start=start, end=end))
+        last_end = end
+    return segments
+
 
+def ensure_monotonic_timeline(segments: Sequence[Segment]) -> None:
     # Ensure strictly increasing timelines for downstream calculations.
     for idx in range(1, len(segments)):
         prev = segments[idx - 1]
@@ -109,7 +166,6 @@ def read_segments_from_json3(data: dict) -> List[Segment]:
             current.start = prev.end
         if current.end <= current.start:
             current.end = current.start + 0.5
-    return segments
 
 
 def find_best_match(segments: Sequence[Segment], query: str, max_window: int = 4) -> Optional[Match]:
@@ -119,65 +175,172 @@ def find_best_match(segments: Sequence[Segment], query: str, max_window: int = 4
     if not target:
         return None
 
-    best: Optional[Match] = None
+    # Normalize each segment once and reuse a single matcher indexed on the
+    # query, so difflib only rebuilds its lookup tables for the short side.
+    norm = [normalize(seg.text) for seg in segments]
+    matcher = difflib.SequenceMatcher(None, autojunk=False)
+    matcher.set_seq2(target)
+
+    def build_match(index: int, window: int, score: float) -> Match:
+        window_segments = segments[index : index + window]
+        return Match(
+            text=" ".join(seg.text for seg in window_segments),
+            start=window_segments[0].start,
+            end=window_segments[-1].end,
+            score=score,
+            start_segment_index=index,
+            segment_count=window,
+        )
+
+    # Fast path: a literal hit always outranks fuzzy matches, so locate hits by
+    # scanning the joined transcript before running difflib over every window.
+    offsets: List[int] = []
+    position = 0
+    for text in norm:
+        offsets.append(position)
+        position += len(text) + 1
+    full_normalized = " ".join(norm)
+
+    # Track the winner as (score, index, window); the Match and its raw text
+    # are only built once the search is over.
+    best_score = -1.0
+    best_key: Optional[Tuple[int, int]] = None
+    hit = full_normalized.find(target)
+    while hit != -1:
+        first = bisect.bisect_right(offsets, hit) - 1
+        last = bisect.bisect_right(offsets, hit + len(target) - 1) - 1
+        window = last - first + 1
+        if window <= max_window:
+            matcher.set_seq1(" ".join(norm[first : last + 1]).strip())
+            ratio = matcher.ratio() + 0.5
+            if ratio > best_score:
+                best_score, best_key = ratio, (first, window)
+        hit = full_normalized.find(target, hit + 1)
+    if best_key is not None:
+        return build_match(*best_key, best_score)
+
+    # No window contains the query verbatim, so scores are plain similarity.
+    if rf_process is not None:
+        keys: List[Tuple[int, int]] = []
+        candidates: List[str] = []
+        for window in range(1, max_window + 1):
+            for index in range(0, len(segments) - window + 1):
+                normalized = " ".join(norm[index : index + window]).strip()
+                if normalized:
+                    keys.append((index, window))
+                    candidates.append(normalized)
+        # fuzz.ratio counts the longest common subsequence, which is never
+        # shorter than difflib's matching blocks, so it bounds ratio() from
+        # above. Rescore windows in descending bound order and stop once none
+        # left can win; the result is identical to the loop below.
+        ranked = rf_process.extract(
+            target, candidates, scorer=rf_fuzz.ratio, processor=None, limit=None
+        )
+        best_position = -1
+        for _choice, bound, position in ranked:
+            if bound / 100.0 + 1e-9 < best_score:
+                break
+            matcher.set_seq1(candidates[position])
+            ratio = matcher.ratio()
+            # Ties go to the earliest window, as in the loop below.
+            if ratio > best_score or (ratio == best_score and position < best_position):
+                best_score, best_position = ratio, position
+        if best_position < 0:
+            return None
+        return build_match(*keys[best_position], best_score)
+
+    target_length = len(target)
     for window in range(1, max_window + 1):
         for index in range(0, len(segments) - window + 1):
-            window_segments = segments[index : index + window]
-            combined = " ".join(seg.text for seg in window_segments)
-            normalized = normalize(combined)
+            normalized = " ".join(norm[index : index + window]).strip()
             if not normalized:
                 continue
-            ratio = difflib.SequenceMatcher(None, target, normalized).ratio()
-            if target in normalized:
-                ratio += 0.5
-            if best is None or ratio > best.score:
-                best = Match(
-                    text=combined,
-                    start=window_segments[0].start,
-                    end=window_segments[-1].end,
-                    score=ratio,
-                    start_segment_index=index,
-                    segment_count=window,
-                )
-    return best
+            # Cheapest bound first: ratio can never exceed the length ratio.
+            length = len(normalized)
+            if 2 * min(target_length, length) / (target_length + length) <= best_score:
+                continue
+            matcher.set_seq1(normalized)
+            if matcher.quick_ratio() <= best_score:
+                continue
+            ratio = matcher.ratio()
+            if ratio > best_score:
+                best_score, best_key = ratio, (index, window)
+    if best_key is None:
+        return None
+    return build_match(*best_key, best_score)
+
+
+def subtitle_languages(lang: str) -> List[str]:
+    return [lang, f"{lang}.orig", f"{lang}-orig"]
+
+
+def cached_transcript_path(video_id: str, lang: str) -> Optional[Path]:
+    now = time.time()
+    for candidate in subtitle_languages(lang):
+        path = TRANSCRIPT_CACHE_DIR / f"{video_id}.{candidate}.json3"
+        try:
+            if now - path.stat().st_mtime <= TRANSCRIPT_CACHE_TTL:
+                return path
+        except OSError:
+            continue
+    return None
 
 
 def fetch_transcript_segments(url: str, lang: str) -> List[Segment]:
-    tmpdir = Path.cwd() / ".clipper_tmp"
-    tmpdir.mkdir(exist_ok=True)
+    # Subtitles are kept on disk keyed by video ID and language, so clipping
+    # the same video again skips the network round-trip entirely.
+    # URLs that aren't recognisably YouTube yield no ID and skip the cache.
+    video_id = video_id_from_url(url)
+    cached = cached_transcript_path(video_id, lang) if video_id else None
+    if cached is not None:
+        try:
+            return read_segments_from_json3(json_loads(cached.read_bytes()))
+        except Exception:
+            # A truncated or corrupt entry is a miss; the download below
+            # overwrites it instead of failing every run until it expires.
+            pass
 
-    outtmpl = str(tmpdir / "%(id)s.%(ext)s")
+    TRANSCRIPT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    outtmpl = os.path.join(str(TRANSCRIPT_CACHE_DIR).replace("%", "%%"), "%(id)s.%(ext)s")
     ydl_opts = {
         "skip_download": True,
         "writesubtitles": True,
         "writeautomaticsub": True,
         "subtitlesformat": "json3",
-        "subtitleslangs": [lang, f"{lang}.orig", f"{lang}-orig"],
+        "subtitleslangs": subtitle_languages(lang),
         "outtmpl": outtmpl,
+        # Refresh expired cache entries instead of keeping the stale file.
+        "overwrites": True,
         "quiet": True,
         "no_warnings": True,
     }
     with YoutubeDL(ydl_opts) as ydl:
-        ydl.download([url])
+        info = ydl.extract_info(url, download=True) or {}
 
-    json_files = sorted(tmpdir.glob("*.json3"), key=lambda path: path.stat().st_mtime, reverse=True)
+    subtitles = (info.get("requested_subtitles") or {}).values()
+    json_files = [Path(sub["filepath"]) for sub in subtitles if sub.get("filepath")]
+    json_files = [path for path in json_files if path.suffix == ".json3" and path.exists()]
     if not json_files:
         raise TranscriptUnavailableError(
             "No subtitles were downloaded. Try a different language code or enable --auto-transcribe."
         )
+    return read_segments_from_json3(json_loads(json_files[0].read_bytes()))
 
-    latest = json_files[0]
-    try:
-        data = json.loads(latest.read_text(encoding="utf-8"))
-    finally:
-        # Clean up temporary subtitle files to avoid clutter.
-        for file_path in json_files:
-            try:
-                file_path.unlink()
-            except OSError:
-                pass
 
-    return read_segments_from_json3(data)
+def fetch_video_info(url: str) -> Optional[dict]:
+    """Extract unprocessed video metadata so downloads can skip the page fetch."""
+
+    ydl_opts = {
+        "skip_download": True,
+        "quiet": True,
+        "no_warnings": True,
+        "logger": _SilentLogger(),
+    }
+    try:
+        with YoutubeDL(ydl_opts) as ydl:
+            return ydl.extract_info(url, download=False, process=False)
+    except Exception:
+        return None
 
 
 def download_clip(
@@ -187,25 +350,27 @@ def download_clip(
     output_path: Path,
     video_format: Optional[str],
     verbose: bool = False,
+    video_info: Optional[dict] = None,
 ) -> DownloadResult:
     if end <= start:
         raise ValueError("Clip end must be after clip start.")
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    if output_path.exists():
-        try:
-            output_path.unlink()
-        except OSError:
-            pass
 
     target_ext = output_path.suffix.lstrip(".") or "mp4"
     base_template = str(output_path.with_suffix(""))
-    outtmpl = f"{base_template}.%(ext)s"
+    if output_path.suffix:
+        # The container is already fixed by the suffix, so let yt-dlp write
+        # (and overwrite) the final path directly rather than renaming later.
+        outtmpl = str(output_path).replace("%", "%%")
+    else:
+        outtmpl = f"{base_template}.%(ext)s"
 
     base_opts: dict = {
         "force_keyframes_at_cuts": True,
         "merge_output_format": target_ext,
         "outtmpl": outtmpl,
+        "overwrites": True,
         "quiet": not verbose,
         "no_warnings": not verbose,
     }
@@ -215,30 +380,53 @@ def download_clip(
     requested_duration = max(0.0, end - start)
     duration_tolerance = max(1.0, requested_duration * 0.1)
 
-    def finalize_partial() -> Path:
-        produced_path = Path(f"{base_template}.{target_ext}")
-        if produced_path != output_path:
+    def produced_path(info: Optional[dict], template: str) -> Path:
+        # yt-dlp reports where the (merged) file actually landed, which covers
+        # formats that cannot be remuxed into the requested container.
+        for download in (info or {}).get("requested_downloads") or ():
+            filepath = download.get("filepath")
+            if filepath:
+                return Path(filepath)
+        return Path(f"{template}.{target_ext}")
+
+    def finalize_partial(info: Optional[dict]) -> Path:
+        # Only needed when yt-dlp settled on a different container extension.
+        produced = produced_path(info, base_template)
+        if produced != output_path:
             try:
-                produced_path.rename(output_path)
+                produced.replace(output_path)
             except OSError as exc:
                 raise RuntimeError(f"Failed to rename output to {output_path}: {exc}") from exc
         return output_path
 
-    def attempt(extra_opts: dict, outtmpl_override: Optional[str] = None) -> None:
+    def attempt(
+        extra_opts: dict, outtmpl_override: Optional[str] = None, reuse_info: bool = True
+    ) -> Optional[dict]:
+        nonlocal video_info
         opts = dict(base_opts)
         if outtmpl_override is not None:
             opts["outtmpl"] = outtmpl_override
         opts.update(extra_opts)
         with YoutubeDL(opts) as ydl:
-            ydl.download([url])
+            if video_info is not None and reuse_info:
+                try:
+                    # Processing mutates the dict, so each attempt gets its own copy.
+                    return ydl.process_ie_result(copy.deepcopy(video_info), download=True)
+                except Exception:
+                    # The prefetched formats may have expired or be tied to the
+                    # session that fetched them; re-extract from here on so a
+                    # bad prefetch cannot sink every fallback.
+                    video_info = None
+                    raise
+            return ydl.extract_info(url, download=True)
 
     def assess_download(path: Path, label: str) -> DownloadResult:
+        # The info dict only echoes the requested section length, so the file
+        # itself has to be probed to confirm the cut actually happened.
         duration = probe_duration(path)
         if duration is None:
             status(f"{label} completed but duration is unknown; will trim clip locally.")
             return DownloadResult(path=path, partial=False)
-        if requested_duration == 0.0:
-            return DownloadResult(path=path, partial=True)
         if abs(duration - requested_duration) <= duration_tolerance:
             status(
                 f"{label} produced ≈{duration:.2f}s clip (target {requested_duration:.2f}s)."
@@ -251,7 +439,7 @@ def download_clip(
 
     # Attempt precise range download via yt-dlp callback API.
     try:
-        attempt(
+        info = attempt(
             {
                 "download_ranges": lambda info_dict, _ydl: [
                     {"start_time": float(start), "end_time": float(end)}
@@ -263,25 +451,42 @@ def download_clip(
             f"yt-dlp download_ranges failed ({exc}); trying download_sections fallback…"
         )
     else:
-        return assess_download(finalize_partial(), "download_ranges")
+        return assess_download(finalize_partial(info), "download_ranges")
 
     # Try older download_sections syntax as a fallback.
     range_expr = f"*{format_timestamp(start)}-{format_timestamp(end)}"
     try:
-        attempt({"download_sections": [range_expr]})
+        info = attempt({"download_sections": [range_expr]})
     except Exception as exc:
         status(
-            f"download_sections failed ({exc}); falling back to full video download."
+            f"download_sections failed ({exc}); trying ffmpeg input seeking…"
         )
     else:
-        return assess_download(finalize_partial(), "download_sections")
+        return assess_download(finalize_partial(info), "download_sections")
+
+    # Let ffmpeg seek and cut while it fetches the streams, in a single pass.
+    try:
+        info = attempt(
+            {
+                "external_downloader": {"default": "ffmpeg"},
+                "external_downloader_args": {
+                    "ffmpeg_i": ["-ss", f"{start:.3f}", "-to", f"{end:.3f}"],
+                },
+            }
+        )
+    except Exception as exc:
+        status(
+            f"ffmpeg input seeking failed ({exc}); falling back to full video download."
+        )
+    else:
+        return assess_download(finalize_partial(info), "ffmpeg input seeking")
 
     full_base_template = f"{base_template}_full"
     full_outtmpl = f"{full_base_template}.%(ext)s"
     status("Downloading full video (this may take longer)…")
-    attempt({}, outtmpl_override=full_outtmpl)
-    full_path = Path(f"{full_base_template}.{target_ext}")
-    return DownloadResult(path=full_path, partial=False)
+    # Last resort, so always extract afresh rather than trust the prefetch.
+    info = attempt({}, outtmpl_override=full_outtmpl, reuse_info=False)
+    return DownloadResult(path=produced_path(info, full_base_template), partial=False)
 
 
 def download_audio_for_transcription(url: str, verbose: bool = False) -> Path:
@@ -343,6 +548,8 @@ def transcribe_with_provider(
         raise STTProviderError(
             f"Speech-to-text provider '{provider_name}' returned no usable segments."
         )
+    segments.sort(key=lambda seg: seg.start)
+    ensure_monotonic_timeline(segments)
     return segments
 
 
@@ -351,35 +558,43 @@ def write_subtitle_file(
     clip_start: float,
     clip_end: float,
     destination: Path,
+    starts: Optional[Sequence[float]] = None,
+    ends: Optional[Sequence[float]] = None,
 ) -> bool:
-    relevant: List[Segment] = []
-    for segment in segments:
-        if segment.end <= clip_start or segment.start >= clip_end:
-            continue
-        relevant.append(segment)
+    # Segments are time-ordered with non-overlapping spans, so both boundary
+    # lists are sorted and the overlapping range can be found by bisection.
+    if starts is None:
+        starts = [segment.start for segment in segments]
+    if ends is None:
+        ends = [segment.end for segment in segments]
+    lo = bisect.bisect_right(ends, clip_start)
+    hi = bisect.bisect_left(starts, clip_end)
+    relevant = segments[lo:hi]
     if not relevant:
         return False
 
-    lines: List[str] = []
+    buffer = io.StringIO()
     counter = 1
     for segment in relevant:
         seg_start = max(segment.start, clip_start) - clip_start
         seg_end = min(segment.end, clip_end) - clip_start
         if seg_end <= seg_start:
             continue
-        text = re.sub(r"\s+", " ", segment.text).strip()
+        text = _WS_RE.sub(" ", segment.text).strip()
         if not text:
             continue
-        lines.append(str(counter))
-        lines.append(f"{format_srt_timestamp(seg_start)} --> {format_srt_timestamp(seg_end)}")
-        lines.append(text)
-        lines.append("")
+        separator = "\n" if counter > 1 else ""
+        buffer.write(
+            f"{separator}{counter}\n"
+            f"{format_srt_timestamp(seg_start)} --> {format_srt_timestamp(seg_end)}\n"
+            f"{text}\n"
+        )
         counter += 1
 
     if counter == 1:
         return False
 
-    destination.write_text("\n".join(lines), encoding="utf-8")
+    destination.write_text(buffer.getvalue(), encoding="utf-8")
     return True
 
 
@@ -394,9 +609,11 @@ def trim_with_ffmpeg(
     if duration <= 0:
         raise ValueError("Clip end must be after clip start.")
 
-    temp_output = output.with_suffix(output.suffix + ".tmp")
-    if temp_output.exists():
-        temp_output.unlink()
+    # Write straight to the destination unless we would overwrite our input.
+    in_place = source.resolve() == output.resolve()
+    target = output.with_suffix(output.suffix + ".tmp") if in_place else output
+    if in_place and target.exists():
+        target.unlink()
 
     ffmpeg_cmd = [
         "ffmpeg",
@@ -407,10 +624,18 @@ def trim_with_ffmpeg(
         str(source),
         "-t",
         f"{duration:.3f}",
+        "-map",
+        "0",
         "-c",
         "copy",
-        str(temp_output),
+        "-avoid_negative_ts",
+        "make_zero",
     ]
+    if output.suffix.lower() in (".mp4", ".m4a", ".mov"):
+        # Put the index at the front so players can start before the whole
+        # file arrives; ffmpeg pays for it with a second pass over the output.
+        ffmpeg_cmd += ["-movflags", "+faststart"]
+    ffmpeg_cmd.append(str(target))
     stdout = None if verbose else subprocess.DEVNULL
     stderr = None if verbose else subprocess.DEVNULL
     try:
@@ -418,19 +643,35 @@ def trim_with_ffmpeg(
     except FileNotFoundError as exc:
         raise RuntimeError("ffmpeg is required to trim the clip but was not found on PATH.") from exc
     except subprocess.CalledProcessError as exc:
+        # Don't leave a truncated clip behind at the requested output path.
+        try:
+            target.unlink()
+        except OSError:
+            pass
         raise RuntimeError(f"ffmpeg failed to trim the clip: exit code {exc.returncode}") from exc
 
-    try:
-        if output.exists():
-            output.unlink()
-        temp_output.rename(output)
-    except OSError as exc:
-        raise RuntimeError(f"Failed to finalize trimmed clip: {exc}") from exc
+    if in_place:
+        try:
+            target.replace(output)
+        except OSError as exc:
+            raise RuntimeError(f"Failed to finalize trimmed clip: {exc}") from exc
 
     return output
 
 
 def probe_duration(path: Path) -> Optional[float]:
+    if av is not None:
+        # Read the container header in-process instead of spawning ffprobe.
+        try:
+            with av.open(str(path)) as container:
+                # A file without audio or video is not a usable clip.
+                if not (container.streams.video or container.streams.audio):
+                    return None
+                if container.duration:
+                    return container.duration / av.time_base
+        except Exception:
+            pass
+
     command = [
         "ffprobe",
         "-v",
@@ -446,13 +687,12 @@ def probe_duration(path: Path) -> Optional[float]:
             command,
             check=True,
             stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
+            stderr=subprocess.DEVNULL,
         )
     except (FileNotFoundError, subprocess.CalledProcessError):
         return None
-    output = (result.stdout or "").strip().splitlines()
-    if not output:
+    output = (result.stdout or b"").strip().split(b"\n", 1)
+    if not output[0]:
         return None
     try:
         return float(output[0])
@@ -522,13 +762,23 @@ def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
 
 
 def sanitize_for_filename(text: str) -> str:
-    cleaned = re.sub(r"[^\w\s-]", "", text).strip().lower()
-    cleaned = re.sub(r"[\s]+", "_", cleaned)
+    cleaned = _FN_KEEP_RE.sub("", text).strip().lower()
+    cleaned = _WS_RE.sub("_", cleaned)
     return cleaned or "clip"
 
 
 def main(argv: Optional[Sequence[str]] = None) -> int:
     args = parse_args(argv)
+    # Overlap the video metadata lookup with the transcript download; both
+    # are network bound and the download stage reuses the metadata. The
+    # thread is a daemon so early exits never wait on a stalled lookup.
+    video_info: List[Optional[dict]] = [None]
+
+    def lookup_video_info() -> None:
+        video_info[0] = fetch_video_info(args.url)
+
+    info_thread = threading.Thread(target=lookup_video_info, daemon=True)
+    info_thread.start()
     try:
         status("Fetching transcript…")
         segments = fetch_transcript_segments(args.url, args.lang)
@@ -554,6 +804,9 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         print(f"Failed to download transcript: {exc}", file=sys.stderr)
         return 1
 
+    segment_starts = [segment.start for segment in segments]
+    segment_ends = [segment.end for segment in segments]
+
     status(f"Loaded {len(segments)} transcript segments. Searching for best match…")
     match = find_best_match(segments, args.query, max_window=args.max_window)
     if not match:
@@ -568,6 +821,7 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         default_name = f"{sanitize_for_filename(args.query)[:40]}_{int(math.floor(clip_start))}"
         args.output = Path(f"{default_name or snippet}.mp4")
 
+    info_thread.join()
     subtitle_output: Optional[Path] = None
     try:
         status("Downloading clipped video segment with yt-dlp…")
@@ -578,6 +832,7 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
             output_path=args.output,
             video_format=args.video_format,
             verbose=args.verbose,
+            video_info=video_info[0],
         )
         if download_result.partial:
             final_path = download_result.path
@@ -600,7 +855,14 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
                 pass
         status("Writing subtitle file…")
         subtitle_path = final_path.with_suffix(".srt")
-        if write_subtitle_file(segments, clip_start, clip_end, subtitle_path):
+        if write_subtitle_file(
+            segments,
+            clip_start,
+            clip_end,
+            subtitle_path,
+            starts=segment_starts,
+            ends=segment_ends,
+        ):
             status(f"Subtitle file saved to {subtitle_path.resolve()}")
             subtitle_output = subtitle_path
         else:
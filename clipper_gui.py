@@ -3,19 +3,56 @@
 
 from __future__ import annotations
 
+import codecs
+import contextlib
+import io
+import locale
+import os
+import re
 import shlex
 import subprocess
 import sys
 import threading
+import time
 from pathlib import Path
+from typing import Any, Iterator
 import importlib
 from tkinter import filedialog, messagebox, scrolledtext, ttk
+from collections import OrderedDict
 import tkinter as tk
 
-try:
-    from yt_dlp import YoutubeDL
-except ModuleNotFoundError:  # pragma: no cover - optional dependency for title lookup
-    YoutubeDL = None  # type: ignore[assignment]
+# Deliberately free of yt-dlp, which is imported lazily on a worker thread.
+from youtube_ids import video_id_from_url
+
+_TITLE_CACHE_SIZE = 256
+_TITLE_DEBOUNCE_SECONDS = 0.6
+_TITLE_PROMPT = "Enter a URL to preview title."
+_YTDLP_LOADING = "Loading yt-dlp…"
+# Upper bound on how long a title lookup waits for the background import.
+_YTDLP_LOAD_TIMEOUT = 30.0
+_OUTPUT_FLUSH_MS = 50
+_READ_CHUNK_SIZE = 65536
+_STR_POOL_SIZE = 1024
+# Same character class shlex.quote treats as safe; matching tokens need no quoting.
+_SAFE_TOKEN = re.compile(r"\A[A-Za-z0-9_@%+=:,./-]+\Z").match
+_TITLE_YDL_OPTIONS = {
+    "quiet": True,
+    "no_warnings": True,
+    "skip_download": True,
+    "extractor_retries": 0,
+    "socket_timeout": 5,
+}
+
+
+def _fast_quote(token: str) -> str:
+    return token if _SAFE_TOKEN(token) else shlex.quote(token)
+
+
+def _new_output_decoder() -> io.IncrementalNewlineDecoder:
+    # Same encoding and newline translation text-mode pipes would apply, but
+    # safe to feed arbitrary byte chunks (split characters, split CRLF).
+    decoder = codecs.getincrementaldecoder(locale.getpreferredencoding(False))(errors="replace")
+    return io.IncrementalNewlineDecoder(decoder, translate=True)
 
 
 class ClipperGUI(tk.Tk):
@@ -24,12 +61,20 @@ class ClipperGUI(tk.Tk):
         self.title("YouTube QuoteCutter")
         self.resizable(True, True)
         self.script_path = Path(__file__).with_name("clipper.py")
-        self.process: subprocess.Popen[str] | None = None
+        # These tokens never change, so quote them once for the preview.
+        self._static_prefix = f"{shlex.quote(sys.executable)} {shlex.quote(str(self.script_path))}"
+        self.process: subprocess.Popen[bytes] | None = None
 
         self._create_variables()
         self._build_layout()
-        self._wire_variable_listeners()
-        self._update_command_preview()
+        with self._bulk_update():
+            self._wire_variable_listeners()
+        # Importing yt-dlp walks its whole extractor package; do it off the Tk
+        # thread so the window paints immediately.
+        threading.Thread(target=self._load_ytdlp, daemon=True).start()
+        # Only the most recent URL matters; one worker debounces and fetches it.
+        threading.Thread(target=self._title_worker_loop, daemon=True).start()
+        self.after(_OUTPUT_FLUSH_MS, self._flush_output)
         self.after(250, self._maybe_offer_yt_dlp_update)
 
     def _create_variables(self) -> None:
@@ -42,7 +87,7 @@ class ClipperGUI(tk.Tk):
         self.quality_var = tk.StringVar()
         self.verbose_var = tk.BooleanVar(value=False)
         self.command_preview_var = tk.StringVar()
-        self.video_title_var = tk.StringVar(value="Enter a URL to preview title.")
+        self.video_title_var = tk.StringVar(value=_YTDLP_LOADING)
         self.language_options = ["en", "es", "fr", "de", "pt", "it", "ja", "ko"]
         self.quality_options = {
             "Best available": "",
@@ -52,9 +97,30 @@ class ClipperGUI(tk.Tk):
         }
         self.lang_var.set(self.language_options[0])
         self.quality_var.set("Best available")
-        self._title_fetch_after_id: str | None = None
+        # Latest (url, job_id) awaiting a lookup; the event wakes the worker.
+        self._pending_title: tuple[str, int] | None = None
+        self._url_event = threading.Event()
         self._title_request_counter = 0
+        self._title_cache: OrderedDict[str, str] = OrderedDict()
+        # Set by _load_ytdlp; None until loaded, or if yt-dlp is missing.
+        self._YoutubeDL: Any = None
+        self._ydl_ready = threading.Event()
+        # Shared across title lookups; created lazily on a worker thread.
+        self._ydl: Any = None
+        self._ydl_lock = threading.Lock()
         self._offered_update = False
+        self._preview_dirty = False
+        self._suspend_preview = False
+        self._last_cmd_key: tuple | None = None
+        # Repeated field values share one object, so comparing preview keys
+        # hits the identity fast path instead of comparing characters.
+        self._str_pool: dict[Any, Any] = {}
+        self._last_cmd_str = ""
+        # Worker threads buffer output; the Tk thread flushes it on a timer.
+        self._out_buffer: list[str] = []
+        self._out_lock = threading.Lock()
+        # Created per run by _watch_output on POSIX.
+        self._stdout_decoder: io.IncrementalNewlineDecoder | None = None
 
     def _build_layout(self) -> None:
         padding = {"padx": 8, "pady": 4, "sticky": "ew"}
@@ -136,8 +202,9 @@ class ClipperGUI(tk.Tk):
         self.rowconfigure(11, weight=1)
 
     def _wire_variable_listeners(self) -> None:
-        self.url_var.trace_add("write", self._on_url_changed)
-        for var in (
+        # Everything the command preview depends on, in key order.
+        self._tracked_vars: tuple[tk.Variable, ...] = (
+            self.url_var,
             self.query_var,
             self.before_var,
             self.after_var,
@@ -145,25 +212,75 @@ class ClipperGUI(tk.Tk):
             self.output_var,
             self.quality_var,
             self.verbose_var,
-        ):
-            var.trace_add("write", lambda *_args: self._update_command_preview())
+        )
+        self.url_var.trace_add("write", self._on_url_changed)
+        for var in self._tracked_vars[1:]:
+            var.trace_add("write", lambda *_args: self._schedule_preview_refresh())
+
+    def _intern(self, value: Any) -> Any:
+        pool = self._str_pool
+        if len(pool) >= _STR_POOL_SIZE and value not in pool:
+            pool.clear()
+        return pool.setdefault(value, value)
+
+    @contextlib.contextmanager
+    def _bulk_update(self) -> Iterator[None]:
+        # Hold off preview refreshes while several variables change together,
+        # then rebuild once at the end.
+        self._suspend_preview = True
+        try:
+            yield
+        finally:
+            self._suspend_preview = False
+            self._update_command_preview()
+
+    def _schedule_preview_refresh(self) -> None:
+        if self._suspend_preview:
+            return
+        # Coalesce bursts of variable writes into one rebuild per idle cycle.
+        if not self._preview_dirty:
+            self._preview_dirty = True
+            self.after_idle(self._flush_preview)
+
+    def _flush_preview(self) -> None:
+        self._preview_dirty = False
+        self._update_command_preview()
+
+    def _load_ytdlp(self) -> None:
+        try:
+            module = importlib.import_module("yt_dlp")
+            self._YoutubeDL = getattr(module, "YoutubeDL", None)
+        except Exception:  # pragma: no cover - optional dependency for title lookup
+            self._YoutubeDL = None
+        finally:
+            self._ydl_ready.set()
+            self.after(0, self._on_ytdlp_loaded)
+
+    def _on_ytdlp_loaded(self) -> None:
+        # Leave any title status set while loading alone.
+        if self.video_title_var.get() == _YTDLP_LOADING:
+            self.video_title_var.set(_TITLE_PROMPT)
 
     def _maybe_offer_yt_dlp_update(self) -> None:
         if self._offered_update:
             return
+        if not self._ydl_ready.is_set():
+            # The prompt depends on whether yt-dlp imported; check back shortly.
+            self.after(100, self._maybe_offer_yt_dlp_update)
+            return
         self._offered_update = True
         prompt = (
             "yt-dlp works best when it's up to date (YouTube changes frequently).\n\n"
             "Would you like me to run 'pip install --upgrade yt-dlp' now?"
         )
-        if YoutubeDL is None:
+        if self._YoutubeDL is None:
             prompt = (
                 "yt-dlp is not installed, but it's required for clipping.\n\n"
                 "Would you like me to install it now via 'pip install yt-dlp'?"
             )
         if not messagebox.askyesno("Manage yt-dlp", prompt):
             return
-        action = "install" if YoutubeDL is None else "upgrade"
+        action = "install" if self._YoutubeDL is None else "upgrade"
         self._start_yt_dlp_update(action)
 
     def _start_yt_dlp_update(self, action: str) -> None:
@@ -177,29 +294,29 @@ class ClipperGUI(tk.Tk):
         else:
             cmd += ["yt-dlp"]
             human_label = "Installing yt-dlp…"
-        self.after(0, lambda: self._append_output(f"{human_label}\n$ {' '.join(cmd)}\n"))
+        self._queue_output(f"{human_label}\n$ {' '.join(cmd)}\n")
         try:
-            result = subprocess.run(
+            process = subprocess.Popen(
                 cmd,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
                 text=True,
+                bufsize=1,
             )
         except OSError as exc:
-            self.after(
-                0,
-                lambda: messagebox.showerror("yt-dlp update failed", f"Could not run pip: {exc}"),
-            )
+            error = f"Could not run pip: {exc}"
+            self.after(0, lambda: messagebox.showerror("yt-dlp update failed", error))
             return
 
+        # Stream pip's progress through the same buffer as clipper output.
+        with process.stdout:
+            for line in process.stdout:
+                self._queue_output(line)
+        return_code = process.wait()
+
         def finalize() -> None:
-            output_blocks = []
-            if result.stdout:
-                output_blocks.append(result.stdout.strip())
-            if result.stderr:
-                output_blocks.append(result.stderr.strip())
-            if output_blocks:
-                self._append_output("\n".join(output_blocks) + "\n")
-            if result.returncode == 0:
+            self._drain_output()
+            if return_code == 0:
                 self._append_output("yt-dlp is ready.\n")
                 self._refresh_ytdlp_import()
                 messagebox.showinfo("yt-dlp", "yt-dlp is up to date.")
@@ -212,59 +329,97 @@ class ClipperGUI(tk.Tk):
         self.after(0, finalize)
 
     def _refresh_ytdlp_import(self) -> None:
-        global YoutubeDL
+        importlib.invalidate_caches()
+        if "yt_dlp" in sys.modules:
+            # Reloading yt-dlp re-executes hundreds of extractor modules and
+            # leaves stale references behind; clipper.py runs in a fresh
+            # process, so only the title preview keeps the old version.
+            self._append_output(
+                "Clips will use the updated yt-dlp; restart the GUI to refresh title previews too.\n"
+            )
+            return
         try:
-            module = sys.modules.get("yt_dlp")
-            if module is None:
-                module = importlib.import_module("yt_dlp")
-            else:
-                module = importlib.reload(module)
-            YoutubeDL = getattr(module, "YoutubeDL", None)
-            if YoutubeDL is None:
-                raise AttributeError("yt_dlp.YoutubeDL not found after update.")
+            module = importlib.import_module("yt_dlp")
+            youtube_dl = getattr(module, "YoutubeDL", None)
+            if youtube_dl is None:
+                raise AttributeError("yt_dlp.YoutubeDL not found after install.")
+            self._YoutubeDL = youtube_dl
         except Exception:
             # Leave the old reference in place; errors will surface naturally later.
             pass
+        # Drop the shared instance without waiting on the lock; the next title
+        # lookup builds a fresh one from the newly imported module.
+        self._ydl = None
 
     def _on_url_changed(self, *_args: object) -> None:
-        self._update_command_preview()
+        self._schedule_preview_refresh()
         url = self.url_var.get().strip()
-        if self._title_fetch_after_id is not None:
-            self.after_cancel(self._title_fetch_after_id)
-            self._title_fetch_after_id = None
+        # Every edit supersedes whatever lookup is pending or in flight.
+        self._title_request_counter += 1
         if not url:
-            self.video_title_var.set("Enter a URL to preview title.")
-            self._title_request_counter += 1
+            self.video_title_var.set(_TITLE_PROMPT)
+            return
+        video_id = video_id_from_url(url)
+        if video_id is None:
+            self.video_title_var.set("Not a YouTube URL.")
+            return
+        if video_id in self._title_cache:
+            self._title_cache.move_to_end(video_id)
+            self.video_title_var.set(f"Title: {self._title_cache[video_id]}")
             return
         self.video_title_var.set("Fetching title…")
-        self._title_fetch_after_id = self.after(600, lambda u=url: self._start_title_lookup(u))
-
-    def _start_title_lookup(self, url: str) -> None:
-        self._title_fetch_after_id = None
-        self._title_request_counter += 1
-        job_id = self._title_request_counter
-        threading.Thread(target=self._fetch_title_worker, args=(url, job_id), daemon=True).start()
+        self._pending_title = (url, self._title_request_counter)
+        self._url_event.set()
+
+    def _title_worker_loop(self) -> None:
+        while True:
+            self._url_event.wait()
+            self._url_event.clear()
+            pending = self._pending_title
+            # Debounce here rather than with Tk timers: if the URL changes
+            # while we sleep, the event is set again and this one is dropped.
+            time.sleep(_TITLE_DEBOUNCE_SECONDS)
+            if pending is None or pending is not self._pending_title:
+                continue
+            url, job_id = pending
+            if job_id != self._title_request_counter:
+                continue
+            self._fetch_title_worker(url, job_id)
 
     def _fetch_title_worker(self, url: str, job_id: int) -> None:
-        if YoutubeDL is None:
+        title = None
+        # Blocks this worker, never the Tk thread, until the import finishes.
+        if not self._ydl_ready.wait(timeout=_YTDLP_LOAD_TIMEOUT):
+            message = "yt-dlp is still loading; try again shortly."
+        elif self._YoutubeDL is None:
             message = "Install yt-dlp to preview titles."
         else:
             try:
-                with YoutubeDL(
-                    {
-                        "quiet": True,
-                        "no_warnings": True,
-                        "skip_download": True,
-                    }
-                ) as ydl:
-                    info = ydl.extract_info(url, download=False)
-                title = (info or {}).get("title")
+                with self._ydl_lock:
+                    ydl = self._ydl
+                    if ydl is None:
+                        ydl = self._ydl = self._YoutubeDL(_TITLE_YDL_OPTIONS)
+                    # Only the title is needed, so skip format processing.
+                    info = ydl.extract_info(url, download=False, process=False)
+                    title = (info or {}).get("title")
+                    if not title:
+                        info = ydl.extract_info(url, download=False)
+                        title = (info or {}).get("title")
                 message = f"Title: {title}" if title else "Title unavailable."
             except Exception as exc:
                 message = f"Failed to load title: {exc}"
-        self.after(0, lambda: self._apply_title_result(job_id, message))
-
-    def _apply_title_result(self, job_id: int, message: str) -> None:
+        self.after(0, lambda: self._apply_title_result(job_id, message, url, title))
+
+    def _apply_title_result(
+        self, job_id: int, message: str, url: str = "", title: str | None = None
+    ) -> None:
+        # Cache on the Tk thread so the dict is never touched concurrently.
+        video_id = video_id_from_url(url)
+        if title and video_id is not None:
+            self._title_cache[video_id] = title
+            self._title_cache.move_to_end(video_id)
+            if len(self._title_cache) > _TITLE_CACHE_SIZE:
+                self._title_cache.popitem(last=False)
         if job_id != self._title_request_counter:
             return
         self.video_title_var.set(message)
@@ -284,6 +439,20 @@ class ClipperGUI(tk.Tk):
         self.output_text.see("end")
         self.output_text.configure(state="disabled")
 
+    def _queue_output(self, text: str) -> None:
+        with self._out_lock:
+            self._out_buffer.append(text)
+
+    def _drain_output(self) -> None:
+        with self._out_lock:
+            chunks, self._out_buffer = self._out_buffer, []
+        if chunks:
+            self._append_output("".join(chunks))
+
+    def _flush_output(self) -> None:
+        self._drain_output()
+        self.after(_OUTPUT_FLUSH_MS, self._flush_output)
+
     def _build_command(self, require_required: bool = True) -> list[str]:
         url = self.url_var.get().strip()
         query = self.query_var.get().strip()
@@ -325,15 +494,26 @@ class ClipperGUI(tk.Tk):
             raise ValueError(f"Invalid value for {field}: '{value or ''}'") from exc
 
     def _update_command_preview(self) -> None:
+        key = tuple(self._intern(var.get()) for var in self._tracked_vars)
+        if key == self._last_cmd_key:
+            return
+        self._last_cmd_key = key
         try:
             cmd = self._build_command(require_required=False)
         except ValueError:
-            self.command_preview_var.set("Fill in required fields to preview command.")
+            cmd = []
+        if len(cmd) < 3:
+            self._last_cmd_str = ""
+            preview = "Fill in required fields to preview command."
         else:
-            if len(cmd) < 3:
-                self.command_preview_var.set("Fill in required fields to preview command.")
-            else:
-                self.command_preview_var.set(shlex.join(cmd))
+            self._last_cmd_str = preview = self._format_command(cmd)
+        # Skip the write (and the Entry redraw it triggers) when nothing changed.
+        if self.command_preview_var.get() != preview:
+            self.command_preview_var.set(preview)
+
+    def _format_command(self, cmd: list[str]) -> str:
+        # Equivalent to shlex.join(cmd); cmd always starts with the static prefix.
+        return " ".join([self._static_prefix, *map(_fast_quote, cmd[2:])])
 
     def _run_clipper(self) -> None:
         if self.process is not None:
@@ -355,7 +535,10 @@ class ClipperGUI(tk.Tk):
         self.output_text.configure(state="normal")
         self.output_text.delete("1.0", "end")
         self.output_text.configure(state="disabled")
-        self._append_output(f"$ {shlex.join(cmd)}\n\n")
+        # A preview refresh may still be queued for idle; bring the cached
+        # string up to date (a no-op if it already is) and echo that.
+        self._update_command_preview()
+        self._append_output(f"$ {self._last_cmd_str}\n\n")
         self.run_button.configure(state="disabled")
         self.stop_button.configure(state="normal")
 
@@ -364,8 +547,7 @@ class ClipperGUI(tk.Tk):
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
+                bufsize=0,
             )
         except OSError as exc:
             self.process = None
@@ -374,13 +556,57 @@ class ClipperGUI(tk.Tk):
             messagebox.showerror("Failed to start", f"Could not launch clipper.py: {exc}")
             return
 
-        threading.Thread(target=self._stream_output, daemon=True).start()
+        if os.name == "posix":
+            self._watch_output()
+        else:
+            # Windows' createfilehandler only supports sockets, not pipes.
+            threading.Thread(target=self._stream_output, daemon=True).start()
+
+    def _watch_output(self) -> None:
+        # Let the Tk event loop wake up on pipe readability instead of
+        # dedicating a reader thread and marshalling data back with after().
+        assert self.process is not None
+        fd = self.process.stdout.fileno()
+        os.set_blocking(fd, False)
+        self._stdout_decoder = _new_output_decoder()
+        self.tk.createfilehandler(fd, tk.READABLE, self._on_stdout_readable)
+
+    def _on_stdout_readable(self, fd: int, _mask: int) -> None:
+        try:
+            chunk = os.read(fd, _READ_CHUNK_SIZE)
+        except BlockingIOError:
+            return
+        except OSError:
+            chunk = b""
+        if chunk:
+            text = self._stdout_decoder.decode(chunk)
+            if text:
+                self._queue_output(text)
+            return
+        self.tk.deletefilehandler(fd)
+        tail = self._stdout_decoder.decode(b"", final=True)
+        if tail:
+            self._queue_output(tail)
+        assert self.process is not None
+        self.process.stdout.close()
+        self._on_process_finished(self.process.wait())
 
     def _stream_output(self) -> None:
         assert self.process is not None
-        with self.process.stdout:
-            for line in self.process.stdout:
-                self.after(0, self._append_output, line)
+        stdout = self.process.stdout
+        fd = stdout.fileno()
+        decoder = _new_output_decoder()
+        with stdout:
+            while True:
+                chunk = os.read(fd, _READ_CHUNK_SIZE)
+                if not chunk:
+                    break
+                text = decoder.decode(chunk)
+                if text:
+                    self._queue_output(text)
+        tail = decoder.decode(b"", final=True)
+        if tail:
+            self._queue_output(tail)
         return_code = self.process.wait()
         self.after(
             0,
@@ -388,6 +614,7 @@ class ClipperGUI(tk.Tk):
         )
 
     def _on_process_finished(self, return_code: int) -> None:
+        self._drain_output()
         self._append_output(f"\nProcess exited with code {return_code}\n")
         self.process = None
         self.run_button.configure(state="normal")
@@ -401,7 +628,8 @@ class ClipperGUI(tk.Tk):
         if self.process is None:
             return
         self.process.terminate()
-        self._append_output("\nTerminating clipper process…\n")
+        # Queue behind any buffered output so the notice lands in order.
+        self._queue_output("\nTerminating clipper process…\n")
 
     def destroy(self) -> None:
         if self.process is not None:
@@ -3,9 +3,10 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Type
+from typing import Dict, List, Optional, Type
 
 
 @dataclass
@@ -30,21 +31,28 @@ class STTProvider:
 
 
 _PROVIDER_REGISTRY: Dict[str, Type[STTProvider]] = {}
+_SORTED_PROVIDERS_CACHE: Optional[List[str]] = None
 
 
 def register_provider(cls: Type[STTProvider]) -> Type[STTProvider]:
     """Class decorator to register STT providers by name."""
 
+    global _SORTED_PROVIDERS_CACHE
     if not cls.name:
         raise ValueError("STT providers must define a non-empty 'name' attribute.")
+    cls.name = sys.intern(cls.name)
     _PROVIDER_REGISTRY[cls.name] = cls
+    _SORTED_PROVIDERS_CACHE = None
     return cls
 
 
 def available_providers() -> List[str]:
     """Return the list of registered provider names."""
 
-    return sorted(_PROVIDER_REGISTRY)
+    global _SORTED_PROVIDERS_CACHE
+    if _SORTED_PROVIDERS_CACHE is None:
+        _SORTED_PROVIDERS_CACHE = sorted(_PROVIDER_REGISTRY)
+    return list(_SORTED_PROVIDERS_CACHE)
 
 
 def get_stt_provider(name: str) -> STTProvider:
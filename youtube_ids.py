@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""Recognise YouTube URLs and extract their video IDs without importing yt-dlp."""
+
+from __future__ import annotations
+
+import re
+from typing import Optional
+
+# Anchored to YouTube hosts and bounded on the right, so a mistyped ID or a
+# ?v= parameter on another site never resolves to some unrelated video.
+YOUTUBE_URL_RE = re.compile(
+    r"(?:https?://)?(?:(?:www|m|music)\.)?"
+    r"(?:youtube\.com/(?:watch\?(?:[^#\s]*?&)?v=|shorts/|live/|embed/)|youtu\.be/)"
+    r"([A-Za-z0-9_-]{11})(?![A-Za-z0-9_-])"
+)
+BARE_VIDEO_ID_RE = re.compile(r"[A-Za-z0-9_-]{11}")
+
+
+def video_id_from_url(url: str) -> Optional[str]:
+    """Return the video ID for a YouTube URL or bare ID, or None for anything else."""
+
+    url = url.strip()
+    if BARE_VIDEO_ID_RE.fullmatch(url):
+        return url
+    match = YOUTUBE_URL_RE.match(url)
+    return match.group(1) if match else None